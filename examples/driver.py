@@ -1,5 +1,3 @@
-import numpy as np
-
 from fem_1d_heat.geometry import (
     global_to_local,
     shape_matrix,
@@ -10,11 +8,11 @@ def main():
     print("successfully imported fem_1d_heat")
 
     z = 3.0
-    z_e = np.array([0, 6])
+    z_e = (0.0, 6.0)
     print(f"testing global_to_local({z}, {z_e}): {global_to_local(z, z_e)}")
 
     z = 2.0
-    z_e = np.array([1, 4])
+    z_e = (1.0, 4.0)
     print(f"testing global_to_local({z}, {z_e}): {global_to_local(z, z_e)}")
 
     s = 0.9
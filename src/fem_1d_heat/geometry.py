@@ -1,75 +1,194 @@
+from math import fabs, inf
+from operator import index
+
 import numpy as np
 
+# Element reference matrices for 1d linear interpolation,
+# scaled by the element properties to give the element matrices
+_M_REF = np.array([[2.0, 1.0], [1.0, 2.0]]) / 6.0
+_K_REF = np.array([[1.0, -1.0], [-1.0, 1.0]])
+_GRAD_REF = np.array([[-1.0, 1.0]])
+
 
 def global_to_local(z, z_e):
     """Converts global coordinate to local (element) coordinate.
 
     Parameters
     ----------
-    z : float
-        The global coordinate to convert to local coordinate
-    z_e : array_like, shape = (2, ), dtype=float_like
-        Nodal coordinates of the element,
-        will be flattened prior to checking shape
+    z : float or array_like, shape = (N, )
+        The global coordinate(s) to convert to local coordinate
+    z_e : array_like, shape = (2, ) or (N, 2), dtype=float_like
+        Nodal coordinates of the element(s),
+        for scalar z will be flattened prior to checking shape,
+        for array z shape (2, ) applies the same element to all z
 
     Returns
     -------
-    float
-        The local coordinate
+    float or numpy.ndarray, shape = (N, )
+        The local coordinate(s)
 
     Raises
     ------
     ValueError
         If z is not convertible to float
         If z_e values are not convertible to float
-        If len(z_e) is not 2
+        If len(z_e) is not 2 (scalar z)
+        If z has more than one dimension (array z)
+        If z_e shape is not (2, ) or (N, 2) (array z)
     """
-    z = float(z)
-    z_e = np.array(z_e, dtype=float).flatten()
-    if len(z_e) != 2:
-        raise ValueError(f"z_e contains {len(z_e)} entries, should be 2")
-    return (z - z_e[0]) / (z_e[1] - z_e[0])
+    if np.ndim(z) == 0:
+        z = float(z)
+        if type(z_e) is np.ndarray and z_e.shape == (2,) and z_e.dtype == np.float64:
+            # already valid, skip the copy and checks
+            return (z - z_e[0]) / (z_e[1] - z_e[0])
+        z_e = np.array(z_e, dtype=float).flatten()
+        if len(z_e) != 2:
+            raise ValueError(f"z_e contains {len(z_e)} entries, should be 2")
+        return (z - z_e[0]) / (z_e[1] - z_e[0])
+    z = _batch_array(z, "z")
+    z_e = np.asarray(z_e, dtype=float)
+    if z_e.shape == (2,):
+        z_e = z_e[None, :]
+    elif z_e.shape != (len(z), 2):
+        raise ValueError(f"z_e has shape {z_e.shape}, should be (2, ) or ({len(z)}, 2)")
+    return (z - z_e[:, 0]) / (z_e[:, 1] - z_e[:, 0])
+
+
+def _inverse_dz(dz):
+    # 1 / dz, infinite for a zero-thickness element
+    return 1.0 / dz if dz > 0.0 else inf
+
+
+def _inverse_dz_batch(dz):
+    # 1 / dz for an array, infinite for zero-thickness elements
+    return np.divide(1.0, dz, out=np.full_like(dz, inf), where=dz > 0.0)
+
+
+def _element_batch(dz, prop, name):
+    # validated 1d arrays of element thicknesses and a material property
+    dz = _batch_array(dz, "dz")
+    prop = _batch_array(prop, name)
+    if len(dz) != len(prop):
+        raise ValueError(
+            f"dz contains {len(dz)} entries and {name} contains {len(prop)}, "
+            "should be equal"
+        )
+    if np.any(dz < 0.0):
+        raise ValueError("dz contains negative values")
+    if np.any(prop < 0.0):
+        raise ValueError(f"{name} contains values < 0.0")
+    return dz, prop
+
+
+def _conductivity_matrix_core(thm_cond, inv_dz, out):
+    # element conductivity matrix from scalar properties, writes into out
+    return np.multiply(thm_cond * inv_dz, _K_REF, out=out)
 
 
-def shape_matrix(s):
+def _storage_matrix_core(vol_heat_cap, dz, out):
+    # element storage matrix from scalar properties, writes into out
+    return np.multiply(dz * vol_heat_cap, _M_REF, out=out)
+
+
+def _shape_matrix_core(s, out):
+    # unchecked kernel of shape_matrix(), writes into out
+    out[0, 0] = 1.0 - s
+    out[0, 1] = s
+
+
+def _gradient_matrix_core(dz, out):
+    # unchecked kernel of gradient_matrix(), writes into out
+    np.divide(_GRAD_REF, dz, out=out)
+
+
+def _batch_array(value, name):
+    # convert to a 1d float array, scalars become shape (1, )
+    value = np.asarray(value, dtype=float)
+    if value.ndim > 1:
+        raise ValueError(f"{name} has {value.ndim} dimensions, should be at most 1")
+    return value.reshape(-1)
+
+
+def shape_matrix(s, out=None):
     """Calculate the shape function matrix for 1d linear interpolation.
 
     Parameters
     ----------
-    s : float
-        The local coordinate in the element
+    s : float or array_like, shape = (N, )
+        The local coordinate(s) in the element
+    out : numpy.ndarray, shape = (1, 2), optional
+        Array to write the result into, a new array is allocated if None,
+        only supported for scalar s
 
     Returns
     -------
-    numpy.ndarray, shape = (1, 2)
-        The shape function matrix
+    numpy.ndarray, shape = (1, 2) or (N, 1, 2)
+        The shape function matrix (matrices for array s)
 
     Raises
     ------
     ValueError
         If s is not convertible to float
         If s is not between 0.0 and 1.0
+        If s has more than one dimension
+        If out is given for array s
     """
+    if np.ndim(s) != 0:
+        if out is not None:
+            raise ValueError("out is only supported for scalar s")
+        return shape_matrix_vec(s)
     s = float(s)
     if s < 0.0 or s > 1.0:
         raise ValueError(f"s == {s} is not between 0.0 and 1.0")
-    return np.array([[(1 - s), s]])
+    if out is None:
+        out = np.empty((1, 2))
+    _shape_matrix_core(s, out)
+    return out
 
 
-def gradient_matrix(s, dz):
+def shape_matrix_vec(s):
+    """Calculate the shape function matrices for an array of local coordinates.
+
+    Parameters
+    ----------
+    s : array_like, shape = (N, )
+        The local coordinates in the element(s)
+
+    Returns
+    -------
+    numpy.ndarray, shape = (N, 1, 2)
+        The shape function matrices
+
+    Raises
+    ------
+    ValueError
+        If s is not convertible to float
+        If any s is not between 0.0 and 1.0
+        If s has more than one dimension
+    """
+    s = _batch_array(s, "s")
+    if np.any((s < 0.0) | (s > 1.0)):
+        raise ValueError("s contains values not between 0.0 and 1.0")
+    return np.stack([1.0 - s, s], axis=-1)[:, None, :]
+
+
+def gradient_matrix(s, dz, out=None):
     """Calculate the gradient matrix for 1d linear interpolation.
 
     Parameters
     ----------
-    s : float
-        The local coordinate in the element
-    dz : float
-        The scaling factor from global to local coordinates
+    s : float or array_like, shape = (N, )
+        The local coordinate(s) in the element
+    dz : float or array_like, shape = (N, )
+        The scaling factor(s) from global to local coordinates
+    out : numpy.ndarray, shape = (1, 2), optional
+        Array to write the result into, a new array is allocated if None,
+        only supported for scalar s and dz
 
     Returns
     -------
-    numpy.ndarray, shape = (1, 2)
-        The gradient matrix
+    numpy.ndarray, shape = (1, 2) or (N, 1, 2)
+        The gradient matrix (matrices for array s or dz)
 
     Raises
     ------
@@ -78,14 +197,57 @@ def gradient_matrix(s, dz):
         If s is not between 0.0 and 1.0
         If dz is not convertible to float
         If dz is negative
+        If s or dz has more than one dimension
+        If out is given for array s or dz
     """
+    if np.ndim(s) != 0 or np.ndim(dz) != 0:
+        if out is not None:
+            raise ValueError("out is only supported for scalar s and dz")
+        return gradient_matrix_vec(s, dz)
     s = float(s)
     if s < 0.0 or s > 1.0:
         raise ValueError(f"s == {s} is not between 0.0 and 1.0")
     dz = float(dz)
     if dz < 0.0:
         raise ValueError(f"dz == {dz} is negative")
-    return np.array([[-1.0, 1.0]]) / dz
+    if out is None:
+        out = np.empty((1, 2))
+    _gradient_matrix_core(dz, out)
+    return out
+
+
+def gradient_matrix_vec(s, dz):
+    """Calculate the gradient matrices for an array of local coordinates.
+
+    Parameters
+    ----------
+    s : float or array_like, shape = (N, )
+        The local coordinate(s) in the element(s)
+    dz : float or array_like, shape = (N, )
+        The scaling factor(s) from global to local coordinates
+
+    Returns
+    -------
+    numpy.ndarray, shape = (N, 1, 2)
+        The gradient matrices
+
+    Raises
+    ------
+    ValueError
+        If s or dz is not convertible to float
+        If any s is not between 0.0 and 1.0
+        If any dz is negative
+        If s or dz has more than one dimension
+        If the shapes of s and dz are not compatible
+    """
+    s = _batch_array(s, "s")
+    if np.any((s < 0.0) | (s > 1.0)):
+        raise ValueError("s contains values not between 0.0 and 1.0")
+    dz = _batch_array(dz, "dz")
+    if np.any(dz < 0.0):
+        raise ValueError("dz contains negative values")
+    inv_dz = np.broadcast_to(1.0 / dz, np.broadcast_shapes(s.shape, dz.shape))
+    return inv_dz[:, None, None] * _GRAD_REF[None, :, :]
 
 
 class Point:
@@ -97,6 +259,8 @@ class Point:
         Depth of the Point
     """
 
+    __slots__ = ("_z",)
+
     def __init__(self, z=0.0):
         self.z = z
 
@@ -138,6 +302,8 @@ class Node(Point):
         Temperature of the Node
     """
 
+    __slots__ = ("_temp",)
+
     def __init__(self, z=0.0, temp=0.0):
         self.temp = temp
         self.z = z
@@ -191,9 +357,15 @@ class Element:
         If len(nodes) != 2
     """
 
-    # Gauss quadrature points and weights [0, 1] domain
-    _int_pts = np.array([0.21132486540518708, 0.7886751345948129])
-    _int_wts = np.array([0.5, 0.5])
+    __slots__ = (
+        "_nodes",
+        "_z0",
+        "_z1",
+        "_dz",
+        "_inv_dz",
+        "_thm_cond",
+        "_vol_heat_cap",
+    )
 
     def __init__(self, nodes, thm_cond=0.0, vol_heat_cap=0.0):
         nodes = tuple(nodes)
@@ -203,6 +375,8 @@ class Element:
             if not isinstance(nd, Node):
                 raise TypeError(f"nodes contains {type(nd)} which is not a Node")
         self._nodes = nodes
+        self._z0 = self._z1 = None
+        self._update_dz()
         self.thm_cond = thm_cond
         self.vol_heat_cap = vol_heat_cap
 
@@ -217,6 +391,14 @@ class Element:
         """
         return self._nodes
 
+    def _update_dz(self):
+        # recompute the cached thickness if a Node depth has changed
+        z0, z1 = self._nodes[0]._z, self._nodes[1]._z
+        if z0 != self._z0 or z1 != self._z1:
+            self._z0, self._z1 = z0, z1
+            self._dz = fabs(z1 - z0)
+            self._inv_dz = _inverse_dz(self._dz)
+
     @property
     def dz(self):
         """Element thickness.
@@ -226,7 +408,8 @@ class Element:
         float
             The thickness or length of the element.
         """
-        return np.abs(self.nodes[1].z - self.nodes[0].z)
+        self._update_dz()
+        return self._dz
 
     @property
     def thm_cond(self):
@@ -287,32 +470,580 @@ class Element:
             raise ValueError(f"{value} < 0.0 is not valid")
         self._vol_heat_cap = value
 
-    def conductivity_matrix(self):
+    def conductivity_matrix(self, out=None):
         """conductivity matrix of the element.
 
+        Parameters
+        ----------
+        out : numpy.ndarray, shape = (2, 2), optional
+            Array to write the result into, a new array is allocated if None
+
         Returns
         -------
         numpy.ndarray,shape(2,2)
             conductivity matrix of the element
         """
-        nnod = len(self.nodes)
-        k = np.zeros((nnod, nnod))
-        for s, w in zip(Element._int_pts, Element._int_wts):
-            B = gradient_matrix(s, self.dz)
-            k += B.T @ B * self.dz * self.thm_cond * w
-        return k
+        self._update_dz()
+        return _conductivity_matrix_core(self._thm_cond, self._inv_dz, out)
 
-    def storage_matrix(self):
+    def storage_matrix(self, out=None):
         """storage matrix of the element.
 
+        Parameters
+        ----------
+        out : numpy.ndarray, shape = (2, 2), optional
+            Array to write the result into, a new array is allocated if None
+
         Returns
         -------
         numpy.ndarray, shape=(2, 2)
             storage matrix of the element
         """
-        n_nodes = len(self.nodes)
-        K = np.zeros((n_nodes, n_nodes))
-        for s, w in zip(Element._int_pts, Element._int_wts):
-            N = shape_matrix(s)
-            K += N.T @ N * self.dz * w * self.vol_heat_cap
-        return K
+        self._update_dz()
+        return _storage_matrix_core(self._vol_heat_cap, self._dz, out)
+
+    @staticmethod
+    def assemble_conductivity(dz, thm_cond, out=None):
+        """Conductivity matrices for a batch of elements.
+
+        Parameters
+        ----------
+        dz : array_like, shape = (E, )
+            Thicknesses of the elements
+        thm_cond : array_like, shape = (E, )
+            Thermal conductivities of the elements
+        out : numpy.ndarray, shape = (E, 2, 2), optional
+            Array to write the result into, a new array is allocated if None
+
+        Returns
+        -------
+        numpy.ndarray, shape = (E, 2, 2)
+            conductivity matrices of the elements
+
+        Raises
+        ------
+        ValueError
+            If dz or thm_cond is not convertible to float
+            If dz or thm_cond has more than one dimension
+            If dz and thm_cond have different lengths
+            If any dz is negative
+            If any thm_cond is less than 0.0
+        """
+        dz, thm_cond = _element_batch(dz, thm_cond, "thm_cond")
+        return np.multiply(
+            (thm_cond * _inverse_dz_batch(dz))[:, None, None],
+            _K_REF[None, :, :],
+            out=out,
+        )
+
+    @staticmethod
+    def assemble_storage(dz, vol_heat_cap, out=None):
+        """Storage matrices for a batch of elements.
+
+        Parameters
+        ----------
+        dz : array_like, shape = (E, )
+            Thicknesses of the elements
+        vol_heat_cap : array_like, shape = (E, )
+            Volumetric heat capacities of the elements
+        out : numpy.ndarray, shape = (E, 2, 2), optional
+            Array to write the result into, a new array is allocated if None
+
+        Returns
+        -------
+        numpy.ndarray, shape = (E, 2, 2)
+            storage matrices of the elements
+
+        Raises
+        ------
+        ValueError
+            If dz or vol_heat_cap is not convertible to float
+            If dz or vol_heat_cap has more than one dimension
+            If dz and vol_heat_cap have different lengths
+            If any dz is negative
+            If any vol_heat_cap is less than 0.0
+        """
+        dz, vol_heat_cap = _element_batch(dz, vol_heat_cap, "vol_heat_cap")
+        return np.multiply(
+            (dz * vol_heat_cap)[:, None, None], _M_REF[None, :, :], out=out
+        )
+
+
+class ElementView:
+    """Read-only view of one element of a Mesh.
+
+    Element data is read from the Mesh arrays on access,
+    so no per-element data is stored in the view.
+
+    Parameters
+    ----------
+    mesh : Mesh
+        The mesh containing the element
+    i : int
+        Index of the element in the mesh
+    """
+
+    __slots__ = ("_mesh", "_i")
+
+    def __init__(self, mesh, i):
+        self._mesh = mesh
+        self._i = i
+
+    @property
+    def node_indices(self):
+        """Indices of the nodes of the element in the mesh.
+
+        Returns
+        -------
+        numpy.ndarray, shape = (2, ), dtype = int32
+            Read-only view into the Mesh connectivity
+        """
+        return self._mesh._conn[self._i]
+
+    @property
+    def dz(self):
+        """Element thickness.
+
+        Returns
+        -------
+        float
+            The thickness or length of the element.
+        """
+        m = self._mesh
+        i0, i1 = m._conn[self._i]
+        return fabs(m._z[i1] - m._z[i0])
+
+    @property
+    def thm_cond(self):
+        """Thermal conductivity of the element.
+
+        Returns
+        -------
+        float
+            The thermal conductivity of the element
+        """
+        return float(self._mesh._thm_cond[self._i])
+
+    @property
+    def vol_heat_cap(self):
+        """Volumetric heat capacity of the element.
+
+        Returns
+        -------
+        float
+            The volumetric heat capacity of the element
+        """
+        return float(self._mesh._vol_heat_cap[self._i])
+
+    def conductivity_matrix(self, out=None):
+        """conductivity matrix of the element, see Element.conductivity_matrix."""
+        return _conductivity_matrix_core(self.thm_cond, _inverse_dz(self.dz), out)
+
+    def storage_matrix(self, out=None):
+        """storage matrix of the element, see Element.storage_matrix."""
+        return _storage_matrix_core(self.vol_heat_cap, self.dz, out)
+
+
+class Mesh:
+    """Stores the nodes and elements of a 1d mesh as contiguous arrays.
+
+    Parameters
+    ----------
+    z : array_like, shape = (N, )
+        Depths of the nodes
+    temp : float or array_like, shape = (N, ), optional, default=0.0
+        Temperatures of the nodes
+    connectivity : array_like, shape = (E, 2), optional
+        Indices of the nodes in each element,
+        defaults to consecutive nodes, i.e. [[0, 1], [1, 2], ...]
+    thm_cond : float or array_like, shape = (E, ), optional, default=0.0
+        Thermal conductivities of the elements
+    vol_heat_cap : float or array_like, shape = (E, ), optional, default=0.0
+        Volumetric heat capacities of the elements
+
+    Raises
+    ------
+    ValueError
+        If any input is not convertible to float (int for connectivity)
+        If connectivity contains non-integer values
+        If any input has an incompatible shape
+        If z has more than one dimension
+        If connectivity refers to nodes that do not exist
+        If any thm_cond or vol_heat_cap is less than 0.0
+    """
+
+    def __init__(self, z, temp=0.0, connectivity=None, thm_cond=0.0, vol_heat_cap=0.0):
+        z = _batch_array(z, "z").copy()
+        nnod = len(z)
+        if connectivity is None:
+            connectivity = np.column_stack([np.arange(nnod - 1), np.arange(1, nnod)])
+        connectivity = np.asarray(connectivity)
+        try:
+            with np.errstate(invalid="ignore"):
+                conn = connectivity.astype(np.int32)
+        except (TypeError, ValueError):
+            raise ValueError("connectivity is not convertible to int")
+        if not np.array_equal(conn, connectivity):
+            raise ValueError("connectivity contains non-integer node indices")
+        connectivity = conn
+        if connectivity.ndim != 2 or connectivity.shape[1] != 2:
+            raise ValueError(
+                f"connectivity has shape {connectivity.shape}, should be (E, 2)"
+            )
+        if np.any((connectivity < 0) | (connectivity >= nnod)):
+            raise ValueError("connectivity contains invalid node indices")
+        nel = len(connectivity)
+        self._z = z
+        self._conn = connectivity
+        self._conn.setflags(write=False)
+        # global row/column indices of the local matrix entries, for assembly
+        rows = np.repeat(connectivity, 2, axis=1).ravel().astype(np.intp)
+        cols = np.tile(connectivity, 2).ravel().astype(np.intp)
+        rows.setflags(write=False)
+        cols.setflags(write=False)
+        self._rows = rows
+        self._cols = cols
+        self._global_idx = rows * nnod + cols
+        self._temp = self._node_array(temp, nnod)
+        self._thm_cond = self._element_array(thm_cond, nel, "thm_cond")
+        self._vol_heat_cap = self._element_array(vol_heat_cap, nel, "vol_heat_cap")
+
+    @staticmethod
+    def _node_array(value, nnod):
+        return np.array(np.broadcast_to(np.asarray(value, dtype=float), (nnod,)))
+
+    @staticmethod
+    def _element_array(value, nel, name):
+        value = np.array(np.broadcast_to(np.asarray(value, dtype=float), (nel,)))
+        if np.any(value < 0.0):
+            raise ValueError(f"{name} contains values < 0.0")
+        return value
+
+    @classmethod
+    def from_elements(cls, elements):
+        """Build a Mesh from a sequence of Element objects.
+
+        Nodes shared between elements (the same Node object)
+        are stored once in the Mesh.
+
+        Parameters
+        ----------
+        elements : iterable of Element
+            The elements of the mesh
+
+        Returns
+        -------
+        Mesh
+            The mesh containing the elements
+
+        Raises
+        ------
+        TypeError
+            If elements contains any non-Element objects
+        """
+        elements = tuple(elements)
+        node_index = {}
+        nodes = []
+        conn = np.empty((len(elements), 2), dtype=np.int32)
+        for k, e in enumerate(elements):
+            if not isinstance(e, Element):
+                raise TypeError(f"elements contains {type(e)} which is not an Element")
+            for j, nd in enumerate(e._nodes):
+                i = node_index.get(id(nd))
+                if i is None:
+                    i = node_index[id(nd)] = len(nodes)
+                    nodes.append(nd)
+                conn[k, j] = i
+        return cls(
+            z=np.fromiter((nd._z for nd in nodes), float, len(nodes)),
+            temp=np.fromiter((nd._temp for nd in nodes), float, len(nodes)),
+            connectivity=conn,
+            thm_cond=np.fromiter((e._thm_cond for e in elements), float, len(elements)),
+            vol_heat_cap=np.fromiter(
+                (e._vol_heat_cap for e in elements), float, len(elements)
+            ),
+        )
+
+    def __len__(self):
+        return self.num_elements
+
+    def __getitem__(self, i):
+        """View of the element at index i.
+
+        Parameters
+        ----------
+        i : int
+            Index of the element, negative values count from the end
+
+        Returns
+        -------
+        ElementView
+            View of the element
+
+        Raises
+        ------
+        TypeError
+            If i is not an integer
+        IndexError
+            If i is out of range
+        """
+        i = index(i)
+        nel = self.num_elements
+        if i < 0:
+            i += nel
+        if i < 0 or i >= nel:
+            raise IndexError(f"element index out of range for {nel} elements")
+        return ElementView(self, i)
+
+    @property
+    def num_nodes(self):
+        """Number of nodes in the mesh.
+
+        Returns
+        -------
+        int
+        """
+        return len(self._z)
+
+    @property
+    def num_elements(self):
+        """Number of elements in the mesh.
+
+        Returns
+        -------
+        int
+        """
+        return len(self._conn)
+
+    @property
+    def z(self):
+        """Depths of the nodes.
+
+        Returns
+        -------
+        numpy.ndarray, shape = (N, )
+        """
+        return self._z
+
+    @property
+    def temp(self):
+        """Temperatures of the nodes.
+
+        Parameters
+        ----------
+        value : float or array_like, shape = (N, )
+            The temperatures to be assigned to the nodes
+
+        Returns
+        -------
+        numpy.ndarray, shape = (N, )
+
+        Raises
+        ------
+        ValueError
+            If the input is not convertible to float
+            If the input cannot be broadcast to shape (N, )
+        """
+        return self._temp
+
+    @temp.setter
+    def temp(self, value):
+        self._temp = self._node_array(value, self.num_nodes)
+
+    @property
+    def connectivity(self):
+        """Indices of the nodes in each element.
+
+        Returns
+        -------
+        numpy.ndarray, shape = (E, 2), dtype = int32
+            Read-only, the connectivity is fixed when the Mesh is created
+        """
+        return self._conn
+
+    @property
+    def thm_cond(self):
+        """Thermal conductivities of the elements.
+
+        Parameters
+        ----------
+        value : float or array_like, shape = (E, )
+            The thermal conductivities to be assigned to the elements
+
+        Returns
+        -------
+        numpy.ndarray, shape = (E, )
+
+        Raises
+        ------
+        ValueError
+            If the input is not convertible to float
+            If the input cannot be broadcast to shape (E, )
+            If any input value is less than 0.0
+        """
+        return self._thm_cond
+
+    @thm_cond.setter
+    def thm_cond(self, value):
+        self._thm_cond = self._element_array(value, self.num_elements, "thm_cond")
+
+    @property
+    def vol_heat_cap(self):
+        """Volumetric heat capacities of the elements.
+
+        Parameters
+        ----------
+        value : float or array_like, shape = (E, )
+            The volumetric heat capacities to be assigned to the elements
+
+        Returns
+        -------
+        numpy.ndarray, shape = (E, )
+
+        Raises
+        ------
+        ValueError
+            If the input is not convertible to float
+            If the input cannot be broadcast to shape (E, )
+            If any input value is less than 0.0
+        """
+        return self._vol_heat_cap
+
+    @vol_heat_cap.setter
+    def vol_heat_cap(self, value):
+        self._vol_heat_cap = self._element_array(
+            value, self.num_elements, "vol_heat_cap"
+        )
+
+    @property
+    def dz(self):
+        """Element thicknesses.
+
+        Returns
+        -------
+        numpy.ndarray, shape = (E, )
+        """
+        z, conn = self._z, self._conn
+        return np.abs(z[conn[:, 1]] - z[conn[:, 0]])
+
+    def conductivity_matrices(self, out=None):
+        """conductivity matrices of the elements.
+
+        Parameters
+        ----------
+        out : numpy.ndarray, shape = (E, 2, 2), optional
+            Array to write the result into, a new array is allocated if None
+
+        Returns
+        -------
+        numpy.ndarray, shape = (E, 2, 2)
+            conductivity matrices of the elements
+        """
+        return Element.assemble_conductivity(self.dz, self._thm_cond, out=out)
+
+    def storage_matrices(self, out=None):
+        """storage matrices of the elements.
+
+        Parameters
+        ----------
+        out : numpy.ndarray, shape = (E, 2, 2), optional
+            Array to write the result into, a new array is allocated if None
+
+        Returns
+        -------
+        numpy.ndarray, shape = (E, 2, 2)
+            storage matrices of the elements
+        """
+        return Element.assemble_storage(self.dz, self._vol_heat_cap, out=out)
+
+    def _check_local(self, local):
+        local = np.asarray(local, dtype=float)
+        if local.shape != (self.num_elements, 2, 2):
+            raise ValueError(
+                f"local has shape {local.shape}, "
+                f"should be ({self.num_elements}, 2, 2)"
+            )
+        return local
+
+    def assemble_coo(self, local):
+        """Global (row, column, value) triplets of element matrices.
+
+        Entries with the same row and column are to be summed,
+        e.g. by scipy.sparse.coo_matrix or into a banded matrix.
+
+        Parameters
+        ----------
+        local : array_like, shape = (E, 2, 2)
+            Matrices of the elements
+
+        Returns
+        -------
+        rows : numpy.ndarray, shape = (4 * E, ), dtype = intp
+            Global row indices (read-only)
+        cols : numpy.ndarray, shape = (4 * E, ), dtype = intp
+            Global column indices (read-only)
+        values : numpy.ndarray, shape = (4 * E, )
+            Entries of the element matrices
+
+        Raises
+        ------
+        ValueError
+            If local is not convertible to float
+            If local does not have shape (E, 2, 2)
+        """
+        local = self._check_local(local)
+        return self._rows, self._cols, local.ravel()
+
+    def assemble_global(self, local):
+        """Assemble element matrices into a dense global matrix.
+
+        Contributions of elements sharing a node are summed.
+        The result needs N**2 memory, use assemble_coo() for large meshes.
+
+        Parameters
+        ----------
+        local : array_like, shape = (E, 2, 2)
+            Matrices of the elements
+
+        Returns
+        -------
+        numpy.ndarray, shape = (N, N)
+            The global matrix
+
+        Raises
+        ------
+        ValueError
+            If local is not convertible to float
+            If local does not have shape (E, 2, 2)
+        """
+        local = self._check_local(local)
+        nnod = self.num_nodes
+        return np.bincount(
+            self._global_idx, weights=local.ravel(), minlength=nnod * nnod
+        ).reshape(nnod, nnod)
+
+    def conductivity_matrix(self):
+        """Global conductivity matrix of the mesh.
+
+        The matrix is dense and needs N**2 memory (8 * N**2 bytes),
+        use assemble_coo(conductivity_matrices()) for large meshes.
+
+        Returns
+        -------
+        numpy.ndarray, shape = (N, N)
+            conductivity matrix of the mesh
+        """
+        return self.assemble_global(self.conductivity_matrices())
+
+    def storage_matrix(self):
+        """Global storage matrix of the mesh.
+
+        The matrix is dense and needs N**2 memory (8 * N**2 bytes),
+        use assemble_coo(storage_matrices()) for large meshes.
+
+        Returns
+        -------
+        numpy.ndarray, shape = (N, N)
+            storage matrix of the mesh
+        """
+        return self.assemble_global(self.storage_matrices())
@@ -1,4 +1,5 @@
 import unittest
+import warnings
 
 import numpy as np
 
@@ -8,51 +9,95 @@ from fem_1d_heat.geometry import (
     shape_matrix,
     Node,
     Element,
+    ElementView,
+    Mesh,
 )
 
+_Z = 3.0
+_Z_E = np.array([0.0, 6.0])
+_Z_E.setflags(write=False)
+_DUMMY_S = 0.0
+_DZ = 2.0
+_G_REF_LINEAR = np.array([[-0.5, 0.5]])
+_G_REF_LINEAR.setflags(write=False)
+
 
 class TestGlobalToLocal(unittest.TestCase):
-    def setUp(self):
-        self.z_e = np.array([0.0, 6.0])
+    @classmethod
+    def setUpClass(cls):
+        cls.z_batch = np.linspace(0.0, 6.0, 4096)
+        cls.z_e_batch = np.broadcast_to([0.0, 6.0], (4096, 2))
+        cls.ref_s = cls.z_batch / 6.0
 
     def test_valid_float_output(self):
-        s_act = global_to_local(3.0, self.z_e)
+        s_act = global_to_local(_Z, _Z_E)
         self.assertIsInstance(s_act, float)
 
     def test_valid_input_beg(self):
         s_exp = 0.0
-        s_act = global_to_local(self.z_e[0], self.z_e)
+        s_act = global_to_local(_Z_E[0], _Z_E)
         self.assertAlmostEqual(s_act, s_exp)
 
     def test_valid_input_mid(self):
         s_exp = 0.5
-        s_act = global_to_local(np.mean(self.z_e), self.z_e)
+        s_act = global_to_local(np.mean(_Z_E), _Z_E)
         self.assertAlmostEqual(s_act, s_exp)
 
     def test_valid_input_end(self):
         s_exp = 1.0
-        s_act = global_to_local(self.z_e[1], self.z_e)
+        s_act = global_to_local(_Z_E[1], _Z_E)
         self.assertAlmostEqual(s_act, s_exp)
 
     def test_invalid_str_input_z(self):
         with self.assertRaises(ValueError):
-            global_to_local("two", self.z_e)
+            global_to_local("two", _Z_E)
 
     def test_invalid_str_input_ze(self):
         with self.assertRaises(ValueError):
-            global_to_local(3.0, "two")
+            global_to_local(_Z, "two")
 
     def test_invalid_len_ze(self):
         with self.assertRaises(ValueError):
-            global_to_local(3.0, [0.0])
+            global_to_local(_Z, [0.0])
+
+    def test_valid_batch_input(self):
+        s_act = global_to_local(self.z_batch, self.z_e_batch)
+        np.testing.assert_allclose(s_act, self.ref_s, rtol=1e-12)
+        s_act = global_to_local(self.z_batch, _Z_E)
+        np.testing.assert_allclose(s_act, self.ref_s, rtol=1e-12)
+
+    def test_valid_array_input(self):
+        z = np.array([0.0, 3.0, 6.0, 2.0])
+        z_e = np.array([[0.0, 6.0], [0.0, 6.0], [0.0, 6.0], [1.0, 4.0]])
+        s_exp = np.array([0.0, 0.5, 1.0, 1.0 / 3.0])
+        s_act = global_to_local(z, z_e)
+        self.assertIsInstance(s_act, np.ndarray)
+        np.testing.assert_allclose(s_act, s_exp, rtol=1e-12)
+
+    def test_invalid_array_input(self):
+        with self.assertRaises(ValueError):
+            global_to_local(["two", "three"], [[0.0, 6.0], [0.0, 6.0]])
+        with self.assertRaises(ValueError):
+            global_to_local([3.0, 4.0], [0.0, 6.0, 8.0])
+        with self.assertRaises(ValueError):
+            global_to_local([3.0], [0.0, 6.0, 8.0, 10.0])
+        with self.assertRaises(ValueError):
+            global_to_local([3.0, 4.0], [[0.0, 6.0]] * 3)
+        with self.assertRaises(ValueError):
+            global_to_local([[3.0, 4.0]], [[0.0, 6.0]] * 2)
 
 
 class TestShapeMatrix(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.s = np.linspace(0.0, 1.0, 4096)
+        cls.ref_N = np.column_stack([1.0 - cls.s, cls.s])
+
     def test_valid_input(self):
         x_exp = np.array([[0.2, 0.8]])
         x_act = shape_matrix(0.8)
         self.assertIsInstance(x_act, np.ndarray)
-        self.assertTrue(np.allclose(x_exp, x_act))
+        np.testing.assert_allclose(x_act, x_exp, rtol=1e-12)
 
     def test_invalid_input(self):
         with self.assertRaises(ValueError):
@@ -62,34 +107,117 @@ class TestShapeMatrix(unittest.TestCase):
         with self.assertRaises(ValueError):
             shape_matrix(1.1)
 
+    def test_out_buffer(self):
+        out = np.zeros((1, 2))
+        x_act = shape_matrix(0.8, out=out)
+        self.assertIs(x_act, out)
+        np.testing.assert_allclose(out, [[0.2, 0.8]], rtol=1e-12)
+
+    def test_valid_batch_input(self):
+        x_act = shape_matrix(self.s)
+        self.assertEqual(x_act.shape, (4096, 1, 2))
+        np.testing.assert_allclose(x_act.reshape(-1, 2), self.ref_N, rtol=1e-12)
+
+    def test_invalid_batch_input(self):
+        with self.assertRaises(ValueError):
+            shape_matrix(["half", 0.5])
+        with self.assertRaises(ValueError):
+            shape_matrix([0.5, -0.1])
+        with self.assertRaises(ValueError):
+            shape_matrix([1.1, 0.5])
+        with self.assertRaises(ValueError):
+            shape_matrix([[0.1, 0.2], [0.3, 0.4]])
+        with self.assertRaises(ValueError):
+            shape_matrix([0.1, 0.2], out=np.empty((1, 2)))
+
 
 class TestGradientMatrix(unittest.TestCase):
     """This class is setup for the linear case such that the s parameter is
     unused and such we feed a placeholder value of zero into it."""
 
-    def setUp(self):
-        self.dummy_s = 0.0
-        self.dz = 2.0
+    @classmethod
+    def setUpClass(cls):
+        cls.s = np.linspace(0.0, 1.0, 4096)
+        cls.dz_batch = np.linspace(0.5, 4.0, 4096)
+        cls.ref_B = np.column_stack([-1.0 / cls.dz_batch, 1.0 / cls.dz_batch])
 
     def test_valid_input(self):
-        exp_result = np.array([-0.5, 0.5])
-        exp_shape = (1, 2)
-        act_result = gradient_matrix(self.dummy_s, self.dz)
+        act_result = gradient_matrix(_DUMMY_S, _DZ)
         self.assertIsInstance(act_result, np.ndarray)
-        self.assertEqual(act_result.shape, exp_shape)
-        self.assertTrue(np.allclose(act_result, exp_result))
+        self.assertEqual(act_result.shape, _G_REF_LINEAR.shape)
+        np.testing.assert_allclose(act_result, _G_REF_LINEAR, rtol=1e-12)
 
     def test_invalid_input(self):
         with self.assertRaises(ValueError):
-            gradient_matrix("five", self.dz)
+            gradient_matrix("five", _DZ)
         with self.assertRaises(ValueError):
-            gradient_matrix(-0.1, self.dz)
+            gradient_matrix(-0.1, _DZ)
         with self.assertRaises(ValueError):
-            gradient_matrix(1.1, self.dz)
+            gradient_matrix(1.1, _DZ)
         with self.assertRaises(ValueError):
-            gradient_matrix(self.dummy_s, "five")
+            gradient_matrix(_DUMMY_S, "five")
         with self.assertRaises(ValueError):
-            gradient_matrix(self.dummy_s, -0.5)
+            gradient_matrix(_DUMMY_S, -0.5)
+
+    def test_out_buffer(self):
+        out = np.zeros((1, 2))
+        act_result = gradient_matrix(_DUMMY_S, _DZ, out=out)
+        self.assertIs(act_result, out)
+        np.testing.assert_allclose(out, _G_REF_LINEAR, rtol=1e-12)
+
+    def test_valid_batch_input(self):
+        act_result = gradient_matrix(self.s, self.dz_batch)
+        self.assertEqual(act_result.shape, (4096, 1, 2))
+        np.testing.assert_allclose(act_result.reshape(-1, 2), self.ref_B, rtol=1e-12)
+
+    def test_valid_batch_broadcast(self):
+        act_result = gradient_matrix(_DUMMY_S, self.dz_batch)
+        np.testing.assert_allclose(act_result.reshape(-1, 2), self.ref_B, rtol=1e-12)
+        act_result = gradient_matrix(self.s, _DZ)
+        self.assertEqual(act_result.shape, (4096, 1, 2))
+        np.testing.assert_allclose(
+            act_result, np.broadcast_to(_G_REF_LINEAR, (4096, 1, 2)), rtol=1e-12
+        )
+
+    def test_invalid_batch_input(self):
+        with self.assertRaises(ValueError):
+            gradient_matrix(["five", 0.5], _DZ)
+        with self.assertRaises(ValueError):
+            gradient_matrix([0.5, 1.1], _DZ)
+        with self.assertRaises(ValueError):
+            gradient_matrix([0.5, 0.5], [_DZ, -0.5])
+        with self.assertRaises(ValueError):
+            gradient_matrix([0.5, 0.5], [_DZ, _DZ, _DZ])
+        with self.assertRaises(ValueError):
+            gradient_matrix([[0.1, 0.2], [0.3, 0.4]], _DZ)
+        with self.assertRaises(ValueError):
+            gradient_matrix(_DUMMY_S, [[_DZ, _DZ]])
+        with self.assertRaises(ValueError):
+            gradient_matrix(_DUMMY_S, [_DZ, _DZ], out=np.empty((1, 2)))
+
+
+class TestKernelConsistency(unittest.TestCase):
+    """Compares the scalar kernels, evaluated point by point into rows of a
+    preallocated output, against the batched evaluation over the same sweep."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.s = np.linspace(0.0, 1.0, 10_000)
+        cls.dz = np.linspace(0.5, 4.0, 10_000)
+
+    def test_shape_matrix(self):
+        x_scalar = np.empty((len(self.s), 2))
+        for k, s in enumerate(self.s):
+            shape_matrix(s, out=x_scalar[k : k + 1])
+        x_batch = shape_matrix(self.s).reshape(-1, 2)
+        np.testing.assert_allclose(x_scalar, x_batch, rtol=1e-15)
+
+    def test_gradient_matrix(self):
+        b_scalar = np.empty((len(self.s), 2))
+        for k, (s, dz) in enumerate(zip(self.s, self.dz)):
+            gradient_matrix(s, dz, out=b_scalar[k : k + 1])
+        b_batch = gradient_matrix(self.s, self.dz).reshape(-1, 2)
+        np.testing.assert_allclose(b_scalar, b_batch, rtol=1e-15)
 
 
 # TODO: implement Point tests
@@ -142,6 +270,244 @@ class TestElement(unittest.TestCase):
         with self.assertRaises(ValueError):
             e.vol_heat_cap = -0.1
 
+    def test_storage_matrix(self):
+        e = Element(self.nodes, self.thm_cond, self.vol_heat_cap)
+        c = self.vol_heat_cap * 1.5 / 6.0
+        M_exp = c * np.array([[2.0, 1.0], [1.0, 2.0]])
+        M_act = e.storage_matrix()
+        self.assertEqual(M_act.shape, (2, 2))
+        self.assertTrue(np.allclose(M_act, M_exp))
+
+    def test_conductivity_matrix(self):
+        e = Element(self.nodes, self.thm_cond, self.vol_heat_cap)
+        c = self.thm_cond / 1.5
+        K_exp = c * np.array([[1.0, -1.0], [-1.0, 1.0]])
+        K_act = e.conductivity_matrix()
+        self.assertEqual(K_act.shape, (2, 2))
+        self.assertTrue(np.allclose(K_act, K_exp))
+
+    def test_moved_node(self):
+        nodes = (Node(0.0), Node(1.0))
+        e = Element(nodes, 1.0, 6.0)
+        self.assertAlmostEqual(e.dz, 1.0)
+        nodes[1].z = 4.0
+        np.testing.assert_allclose(
+            e.conductivity_matrix(), 0.25 * np.array([[1.0, -1.0], [-1.0, 1.0]])
+        )
+        nodes[0].z = 2.0
+        np.testing.assert_allclose(
+            e.storage_matrix(), 2.0 * np.array([[2.0, 1.0], [1.0, 2.0]])
+        )
+        nodes[0].z = 3.5
+        self.assertAlmostEqual(e.dz, 0.5)
+        m = Mesh.from_elements([e])
+        np.testing.assert_allclose(
+            m.conductivity_matrices()[0], e.conductivity_matrix()
+        )
+        np.testing.assert_allclose(m.storage_matrices()[0], e.storage_matrix())
+
+    def test_out_buffer(self):
+        e = Element(self.nodes, self.thm_cond, self.vol_heat_cap)
+        out = np.zeros((2, 2))
+        M_act = e.storage_matrix(out=out)
+        self.assertIs(M_act, out)
+        self.assertTrue(np.allclose(out, e.storage_matrix()))
+        K_act = e.conductivity_matrix(out=out)
+        self.assertIs(K_act, out)
+        self.assertTrue(np.allclose(out, e.conductivity_matrix()))
+
+    def test_assemble_storage(self):
+        elements = [
+            Element(self.nodes, self.thm_cond, self.vol_heat_cap),
+            Element((Node(1.5), Node(2.0)), 1.0, 3.0e2),
+        ]
+        dz = np.array([e.dz for e in elements])
+        vol_heat_cap = np.array([e.vol_heat_cap for e in elements])
+        M_act = Element.assemble_storage(dz, vol_heat_cap)
+        self.assertEqual(M_act.shape, (2, 2, 2))
+        for M, e in zip(M_act, elements):
+            self.assertTrue(np.allclose(M, e.storage_matrix()))
+
+    def test_assemble_conductivity(self):
+        elements = [
+            Element(self.nodes, self.thm_cond, self.vol_heat_cap),
+            Element((Node(1.5), Node(2.0)), 1.0, 3.0e2),
+        ]
+        dz = np.array([e.dz for e in elements])
+        thm_cond = np.array([e.thm_cond for e in elements])
+        K_act = Element.assemble_conductivity(dz, thm_cond)
+        self.assertEqual(K_act.shape, (2, 2, 2))
+        for K, e in zip(K_act, elements):
+            self.assertTrue(np.allclose(K, e.conductivity_matrix()))
+
+    def test_assemble_zero_thickness(self):
+        e = Element((Node(1.0), Node(1.0)), self.thm_cond, self.vol_heat_cap)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            K_act = Element.assemble_conductivity([0.0], [self.thm_cond])
+            M_act = Element.assemble_storage([0.0], [self.vol_heat_cap])
+        np.testing.assert_array_equal(K_act[0], e.conductivity_matrix())
+        np.testing.assert_array_equal(M_act[0], e.storage_matrix())
+
+    def test_assemble_invalid_input(self):
+        for assemble in (Element.assemble_conductivity, Element.assemble_storage):
+            with self.assertRaises(ValueError):
+                assemble(["five"], [1.0])
+            with self.assertRaises(ValueError):
+                assemble([1.0], ["five"])
+            with self.assertRaises(ValueError):
+                assemble([-1.0], [5.0])
+            with self.assertRaises(ValueError):
+                assemble([1.0], [-5.0])
+            with self.assertRaises(ValueError):
+                assemble([1.0, 2.0], [5.0])
+            with self.assertRaises(ValueError):
+                assemble([[1.0, 2.0]], [[5.0, 5.0]])
+
+
+class TestMesh(unittest.TestCase):
+    def setUp(self):
+        self.z = np.array([0.0, 1.5, 2.0, 4.0])
+        self.thm_cond = np.array([6.9e1, 1.0, 2.5])
+        self.vol_heat_cap = np.array([4.2e2, 3.0e2, 1.0e2])
+
+    def test_valid_input(self):
+        m = Mesh(self.z, 10.0, thm_cond=self.thm_cond, vol_heat_cap=self.vol_heat_cap)
+        self.assertEqual(m.num_nodes, 4)
+        self.assertEqual(m.num_elements, 3)
+        self.assertTrue(np.allclose(m.z, self.z))
+        self.assertTrue(np.allclose(m.temp, 10.0))
+        self.assertTrue(np.array_equal(m.connectivity, [[0, 1], [1, 2], [2, 3]]))
+        self.assertTrue(np.allclose(m.dz, [1.5, 0.5, 2.0]))
+        self.assertTrue(np.allclose(m.thm_cond, self.thm_cond))
+        self.assertTrue(np.allclose(m.vol_heat_cap, self.vol_heat_cap))
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            Mesh(["zero", 1.0])
+        with self.assertRaises(ValueError):
+            Mesh([[0.0, 1.0], [2.0, 3.0]])
+        with self.assertRaises(ValueError):
+            Mesh(self.z, temp=[0.0, 1.0])
+        with self.assertRaises(ValueError):
+            Mesh(self.z, connectivity=[0, 1, 2])
+        with self.assertRaises(ValueError):
+            Mesh(self.z, connectivity=[[0, 1], [1, 4]])
+        with self.assertRaises(ValueError):
+            Mesh(self.z, connectivity=[[0.7, 1.9]])
+        with self.assertRaises(ValueError):
+            Mesh(self.z, connectivity=[["zero", "one"]])
+        with self.assertRaises(ValueError):
+            Mesh(self.z, thm_cond=[1.0, -0.1, 1.0])
+        with self.assertRaises(ValueError):
+            Mesh(self.z, vol_heat_cap=-0.1)
+
+    def test_invalid_properties(self):
+        m = Mesh(self.z)
+        with self.assertRaises(ValueError):
+            m.connectivity[0, 1] = 2
+        with self.assertRaises(ValueError):
+            m.thm_cond = "five"
+        with self.assertRaises(ValueError):
+            m.thm_cond = -0.1
+        with self.assertRaises(ValueError):
+            m.vol_heat_cap = [1.0, 1.0]
+        with self.assertRaises(ValueError):
+            m.temp = [1.0, 1.0]
+
+    def test_from_elements(self):
+        nodes = [Node(z, 5.0) for z in self.z]
+        elements = [
+            Element(nodes[k : k + 2], self.thm_cond[k], self.vol_heat_cap[k])
+            for k in range(3)
+        ]
+        m = Mesh.from_elements(elements)
+        self.assertEqual(m.num_nodes, 4)
+        self.assertTrue(np.allclose(m.z, self.z))
+        self.assertTrue(np.allclose(m.temp, 5.0))
+        self.assertTrue(np.array_equal(m.connectivity, [[0, 1], [1, 2], [2, 3]]))
+        for M, K, e in zip(m.storage_matrices(), m.conductivity_matrices(), elements):
+            self.assertTrue(np.allclose(M, e.storage_matrix()))
+            self.assertTrue(np.allclose(K, e.conductivity_matrix()))
+        with self.assertRaises(TypeError):
+            Mesh.from_elements([elements[0], nodes[0]])
+
+    def test_element_views(self):
+        m = Mesh(self.z, thm_cond=self.thm_cond, vol_heat_cap=self.vol_heat_cap)
+        self.assertEqual(len(m), 3)
+        views = list(m)
+        self.assertEqual(len(views), 3)
+        for k, e in enumerate(views):
+            self.assertIsInstance(e, ElementView)
+            self.assertTrue(np.array_equal(e.node_indices, [k, k + 1]))
+            self.assertAlmostEqual(e.dz, m.dz[k])
+            self.assertAlmostEqual(e.thm_cond, self.thm_cond[k])
+            self.assertAlmostEqual(e.vol_heat_cap, self.vol_heat_cap[k])
+            self.assertTrue(np.allclose(e.storage_matrix(), m.storage_matrices()[k]))
+            self.assertTrue(
+                np.allclose(e.conductivity_matrix(), m.conductivity_matrices()[k])
+            )
+        self.assertTrue(np.array_equal(m[-1].node_indices, [2, 3]))
+        with self.assertRaises(ValueError):
+            m[0].node_indices[1] = 3
+        with self.assertRaises(IndexError):
+            m[3]
+        with self.assertRaises(IndexError):
+            m[-4]
+        with self.assertRaises(TypeError):
+            m[0.5]
+
+    def test_global_matrices(self):
+        m = Mesh(self.z, thm_cond=self.thm_cond, vol_heat_cap=self.vol_heat_cap)
+        M_exp = np.zeros((4, 4))
+        K_exp = np.zeros((4, 4))
+        for k, (M, K) in enumerate(
+            zip(m.storage_matrices(), m.conductivity_matrices())
+        ):
+            M_exp[k : k + 2, k : k + 2] += M
+            K_exp[k : k + 2, k : k + 2] += K
+        self.assertTrue(np.allclose(m.storage_matrix(), M_exp))
+        self.assertTrue(np.allclose(m.conductivity_matrix(), K_exp))
+
+    def test_global_matrix_connectivity(self):
+        m = Mesh(self.z[:3], connectivity=[[2, 0], [0, 1]])
+        local = np.array([[[1.0, 2.0], [3.0, 4.0]], [[5.0, 6.0], [7.0, 8.0]]])
+        A_exp = np.array([[9.0, 6.0, 3.0], [7.0, 8.0, 0.0], [2.0, 0.0, 1.0]])
+        self.assertTrue(np.allclose(m.assemble_global(local), A_exp))
+        with self.assertRaises(ValueError):
+            m.assemble_global(np.zeros((3, 2, 2)))
+
+    def test_assemble_coo(self):
+        m = Mesh(self.z, thm_cond=self.thm_cond, vol_heat_cap=self.vol_heat_cap)
+        local = m.storage_matrices()
+        rows, cols, values = m.assemble_coo(local)
+        self.assertEqual(rows.shape, (12,))
+        A_act = np.zeros((4, 4))
+        np.add.at(A_act, (rows, cols), values)
+        np.testing.assert_allclose(A_act, m.assemble_global(local))
+        with self.assertRaises(ValueError):
+            m.assemble_coo(np.zeros((2, 2, 2)))
+
+    def test_large_mesh_indices(self):
+        m = Mesh(np.arange(50_000.0))
+        rows, cols, _ = m.assemble_coo(np.zeros((m.num_elements, 2, 2)))
+        self.assertEqual(rows.max(), 49_999)
+        self.assertEqual(cols.max(), 49_999)
+        self.assertEqual(rows.min(), 0)
+        self.assertEqual(cols.min(), 0)
+        self.assertEqual(rows.dtype, np.intp)
+        self.assertEqual(cols.dtype, np.intp)
+
+    def test_out_buffer(self):
+        m = Mesh(self.z, thm_cond=self.thm_cond, vol_heat_cap=self.vol_heat_cap)
+        out = np.zeros((3, 2, 2))
+        M_act = m.storage_matrices(out=out)
+        self.assertIs(M_act, out)
+        self.assertTrue(np.allclose(out, m.storage_matrices()))
+        K_act = m.conductivity_matrices(out=out)
+        self.assertIs(K_act, out)
+        self.assertTrue(np.allclose(out, m.conductivity_matrices()))
+
 
 if __name__ == "__main__":
     unittest.main()